@@ -2,23 +2,49 @@
 
 import argparse
 import os
-import re
 import signal
 import subprocess
 import sys
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 
-import questionary
-from rich.console import Console
-from rich.panel import Panel
+# Month and weekday names as git prints them; both date formats handled
+# here are fixed, so lookup tables beat the locale machinery of strptime.
+_MONTH_NAMES = [
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+]
+_WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
-GIT_LOG_CMD = "git log --pretty"
-GIT_SET_DATE_TEMPLATE = 'git filter-branch -f --env-filter \'if [ $GIT_COMMIT = {} ]; then export GIT_COMMITTER_DATE="{}"; export GIT_AUTHOR_DATE="{}"; fi\''
+# One record per commit: fields separated by unit separators (0x1f),
+# records terminated by NUL (0x00). Machine-parseable with a single split.
+# --date=raw delivers '<unix_ts> <tz_offset>', so parsing a date is a
+# single int() call and formatting happens only for commits on screen.
+GIT_LOG_CMD = ["git", "log", "--format=%H%x1f%an%x1f%ae%x1f%ad%x1f%s%x00", "--date=raw"]
+GIT_SET_DATE_CMD = ["git", "filter-branch", "-f", "--env-filter"]
 
+# Commits shown per menu page; only this many are fetched and formatted
+# at a time, so startup cost no longer grows with repository size.
+PAGE_SIZE = 50
 
-console = Console()
+# Sentinel choice values for the pagination pseudo-entries.
+_PREV_PAGE = "prev-page"
+_NEXT_PAGE = "next-page"
+GIT_SET_DATE_FILTER_TEMPLATE = 'if [ $GIT_COMMIT = {} ]; then export GIT_COMMITTER_DATE="{}"; export GIT_AUTHOR_DATE="{}"; fi'
+
+
+# Parsed commit lists keyed by (HEAD hash, page offset) and total commit
+# counts keyed by HEAD hash; valid until history is rewritten.
+_log_cache = {}
+_count_cache = {}
+
+# Formatted dates keyed by (ts, tz) and timezone objects keyed by offset
+# string; commits routinely share both, so each distinct value is
+# computed once instead of once per commit.
+_date_cache = {}
+_tz_cache = {}
 
 
 class Commit:
@@ -29,179 +55,314 @@ class Commit:
         hash (str): Commit hash.
         name (str): Author's name.
         email (str): Author's email.
-        date (str): Commit date.
+        ts (int): Commit timestamp in Unix seconds.
+        tz (str): Commit timezone offset, e.g. '+0300'.
         subject (str): Commit subject.
+        display (str): Menu line for the commit, built once at construction.
     """
 
-    def __init__(self, hash: str, name: str, email: str, date: str, subject: str):
+    __slots__ = ("hash", "name", "email", "ts", "tz", "subject", "display")
+
+    def __init__(self, hash: str, name: str, email: str, ts: int, tz: str, subject: str):
         self.hash = hash
         self.name = name
         self.email = email
-        self.date = date
+        self.ts = ts
+        self.tz = tz
         self.subject = subject
+        self.display = f"{self.date} -  {subject}  - {name}"
+
+    def _as_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.ts, _parse_tz_offset(self.tz))
+
+    @property
+    def date(self) -> str:
+        """Commit date in git's 'Tue Oct 8 11:59:23 2024 +0300' format."""
+        date = _date_cache.get((self.ts, self.tz))
+        if date is None:
+            dt = self._as_datetime()
+            weekday = _WEEKDAYS[dt.weekday()]
+            month = _MONTH_NAMES[dt.month - 1]
+            date = f"{weekday} {month} {dt.day} {dt:%H:%M:%S} {dt.year} {self.tz}"
+            _date_cache[(self.ts, self.tz)] = date
+        return date
+
+    @property
+    def input_date(self) -> str:
+        """Commit date in the input-friendly '2024.10.08 11:59:23 +0300' format."""
+        dt = self._as_datetime()
+        return f"{dt.year}.{dt.month:02d}.{dt.day:02d} {dt:%H:%M:%S} {self.tz}"
 
     def __repr__(self) -> str:
-        return f"{self.date} -  {self.subject}  - {self.name}"
+        return self.display
+
 
+def _parse_tz_offset(tz: str) -> timezone:
+    """Returns (and caches) the timezone for a '+0300'-style offset string."""
+    tzinfo = _tz_cache.get(tz)
+    if tzinfo is None:
+        sign = -1 if tz.startswith("-") else 1
+        offset = sign * timedelta(hours=int(tz[1:3]), minutes=int(tz[3:5]))
+        tzinfo = _tz_cache.setdefault(tz, timezone(offset))
+    return tzinfo
 
-def parse_git_log(output_lines: List[str]) -> List[Commit]:
+
+def parse_git_log(output_lines: Iterable[str], size_hint: int = None) -> List[Commit]:
     """
     Parses Git log output into a list of Commit objects.
 
     Args:
-        output_lines (List[str]): Output lines from the Git log command.
+        output_lines (Iterable[str]): Output lines from the Git log command.
+        size_hint (int, optional): Expected number of commits; when given,
+            the result list is preallocated once instead of being grown
+            through repeated appends.
 
     Returns:
         List[Commit]: List of Commit objects.
     """
-    commits = []
-    commit_data = {}
-
-    if not output_lines:
-        return commits
+    commits = [None] * size_hint if size_hint else []
+    index = 0
 
     for line in output_lines:
-        if line.startswith("commit"):
-            if commit_data:
-                commits.append(create_commit(commit_data))
-            commit_data = {"hash": line.split()[1]}
-        elif line.startswith("Author:"):
-            match = re.match(r"Author: (.+) <(.+)>", line)
-            if match:
-                commit_data["name"] = match.group(1).strip()
-                commit_data["email"] = match.group(2).strip()
-        elif line.startswith("Date:"):
-            commit_data["date"] = line.split(":", 1)[1].strip()
-        elif line.strip():
-            commit_data["subject"] = line.strip()
-
-    # Add the last commit
-    if commit_data:
-        commits.append(create_commit(commit_data))
-
+        # One rstrip drops both the record terminator and the newline.
+        record = line.rstrip("\x00\n")
+        if not record:
+            continue
+        hash, name, email, date, subject = record.split("\x1f", 4)
+        ts, tz = date.split()
+        commit = Commit(hash, name, email, int(ts), tz, subject)
+        if index < len(commits):
+            commits[index] = commit
+        else:
+            commits.append(commit)
+        index += 1
+
+    # Trim in place in case the hint overshot the actual commit count.
+    del commits[index:]
     return commits
 
 
-def create_commit(data: dict) -> Commit:
-    """
-    Creates a Commit object from a dictionary.
-
-    Args:
-        data (dict): Dictionary containing commit data.
-
-    Returns:
-        Commit: Commit object.
-    """
-    return Commit(
-        hash=data["hash"],
-        name=data["name"],
-        email=data["email"],
-        date=data["date"],
-        subject=data["subject"],
-    )
-
-
-def convert_commit_date_to_input_date(date_string: str) -> str:
-    """
-    Converts a Git commit date to an input-friendly format.
-
-    Args:
-        date_string (str): Date string in 'Tue Oct 8 11:59:23 2024 +0300' format.
-
-    Returns:
-        str: Date string in '2024.10.8 11:59:23 +0300' format.
-    """
-    dt = datetime.strptime(date_string, "%a %b %d %H:%M:%S %Y %z")
-    return dt.strftime("%Y.%m.%d %H:%M:%S %z")
-
-
 def convert_input_date_to_commit_date(date_string: str) -> str:
     """
-    Converts an input-friendly date to a Git commit date format.
+    Converts an input-friendly date to Git's raw date format.
+
+    GIT_AUTHOR_DATE/GIT_COMMITTER_DATE accept the internal
+    '<unix_ts> <tz_offset>' form directly, so no weekday or month name
+    has to be reconstructed for the rewrite.
 
     Args:
-        date_string (str): Date string in '2024.10.8 11:59:23 +0300' format.
+        date_string (str): Date string in '2024.10.08 11:59:23 +0300' format.
 
     Returns:
-        str: Date string in 'Tue Oct 8 11:59:23 2024 +0300' format.
+        str: Date string in Git's raw '1728377963 +0300' format.
     """
-    dt = datetime.strptime(date_string, "%Y.%m.%d %H:%M:%S %z")
-    return dt.strftime("%a %b %d %H:%M:%S %Y %z")
+    date, time, tz = date_string.split()
+    year, month, day = (int(part) for part in date.split("."))
+    hour, minute, second = (int(part) for part in time.split(":"))
+    dt = datetime(year, month, day, hour, minute, second, tzinfo=_parse_tz_offset(tz))
+    return f"{int(dt.timestamp())} {tz}"
 
 
-def execute_system_command(cmd: str, cwd: str, timeout: int = 10) -> tuple:
+def execute_system_command(cmd: List[str], cwd: str, timeout: int = 10) -> tuple:
     """
     Выполняет системную команду с обработкой ошибок и таймаутом.
 
+    Команда передаётся списком аргументов без промежуточного шелла:
+    одним процессом меньше на вызов, и subprocess может использовать
+    быстрый путь через posix_spawn.
+
     Args:
-        cmd (str): Системная команда для выполнения.
+        cmd (List[str]): Системная команда для выполнения (список аргументов).
         cwd (str): Рабочая директория для выполнения команды.
         timeout (int, optional): Таймаут в секундах. Defaults to 10.
 
     Returns:
-        tuple: Кортеж, содержащий вывод команды (stdout) и индикатор ошибки (bool).
+        tuple: Кортеж, содержащий вывод команды (stdout, bytes) и индикатор
+               ошибки (bool). Вывод возвращается без декодирования — вызывающая
+               сторона декодирует только те части, которые ей нужны.
                Если команда выполнилась успешно, возвращает (stdout, False),
                в случае ошибки или таймаута - (error_message, True).
     """
+    cmd_text = " ".join(cmd)
     try:
         process = subprocess.Popen(
             cmd,
             cwd=cwd,
-            shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            preexec_fn=os.setsid,
+            start_new_session=True,
         )
         stdout, _ = process.communicate(timeout=timeout)
 
         if process.returncode != 0:
             raise subprocess.CalledProcessError(process.returncode, cmd, stdout)
 
-        return str(stdout, "utf-8"), False
+        return stdout, False
 
     except subprocess.CalledProcessError as e:
-        sys.stderr.write(f"Command '{cmd}' failed with error:\n{e.output}")
-        return str(e.output), True
+        sys.stderr.write(f"Command '{cmd_text}' failed with error:\n{e.output}")
+        return e.output, True
 
     except subprocess.TimeoutExpired:
         os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-        error_msg = f"Command '{cmd}' killed by timeout ({timeout}s)"
+        error_msg = f"Command '{cmd_text}' killed by timeout ({timeout}s)"
         sys.stderr.write(error_msg + "\n")
-        return error_msg, True
+        return error_msg.encode("utf-8"), True
 
 
-def get_git_log(repo_path: str, timeout: int = 10) -> List[str]:
+def get_git_log(
+    repo_path: str, timeout: int = 10, limit: int = None, skip: int = 0
+) -> Iterator[str]:
     """
-    Retrieves the Git log output for a given repository.
+    Streams the Git log output for a given repository line by line.
+
+    Parsing can start as soon as git produces its first line, and only one
+    line is held in memory at a time instead of the whole log.
 
     Args:
         repo_path (str): Path to the Git repository.
         timeout (int, optional): Timeout in seconds. Defaults to 10.
+        limit (int, optional): Maximum number of commits to fetch.
+        skip (int, optional): Number of commits to skip from HEAD.
+
+    Yields:
+        str: Output lines from the Git log command, including trailing
+            newlines; stripping is left to the parser.
+    """
+    cmd = list(GIT_LOG_CMD)
+    if limit is not None:
+        cmd += ["-n", str(limit)]
+    if skip:
+        cmd += ["--skip", str(skip)]
+    process = subprocess.Popen(
+        cmd,
+        cwd=repo_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=1,
+        text=True,
+        start_new_session=True,
+    )
+    timer = threading.Timer(
+        timeout, lambda: os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+    )
+    timer.start()
+    try:
+        yield from process.stdout
+    finally:
+        timer.cancel()
+        process.stdout.close()
+        if process.wait() not in (0, -signal.SIGTERM):
+            sys.stderr.write(
+                f"Command '{' '.join(cmd)}' failed "
+                f"with code {process.returncode}\n"
+            )
+
+
+def get_git_head(repo_path: str, timeout: int = 10) -> str:
+    """
+    Returns the hash of HEAD for a given repository.
+
+    HEAD is resolved by reading .git directly, so the per-iteration
+    cache check costs a couple of small file reads instead of a git
+    fork+exec; `git rev-parse` remains as the fallback for layouts the
+    fast path does not cover (worktrees, submodules).
+
+    Args:
+        repo_path (str): Path to the Git repository.
+        timeout (int, optional): Timeout in seconds. Defaults to 10.
+
+    Returns:
+        str: HEAD commit hash or an empty string on error.
+    """
+    git_dir = Path(repo_path) / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text("utf-8").strip()
+        if not head.startswith("ref: "):
+            return head
+        ref = head[5:]
+        ref_file = git_dir / ref
+        if ref_file.is_file():
+            return ref_file.read_text("utf-8").strip()
+        for line in (git_dir / "packed-refs").read_text("utf-8").splitlines():
+            if line.endswith(ref) and not line.startswith(("#", "^")):
+                return line.split()[0]
+    except OSError:
+        pass
+
+    stdout, error_occurred = execute_system_command(
+        ["git", "rev-parse", "HEAD"], repo_path, timeout
+    )
+    return stdout.strip().decode("utf-8") if not error_occurred else ""
+
+
+def start_commit_count(repo_path: str) -> subprocess.Popen:
+    """
+    Launches `git rev-list --count HEAD` without waiting for it.
+
+    The returned process runs concurrently with whatever the caller does
+    next (typically streaming the log page), so the two git invocations
+    cost the maximum of their run times instead of the sum.
+
+    Args:
+        repo_path (str): Path to the Git repository.
 
     Returns:
-        List[str]: Output lines from the Git log command or an empty list on error.
+        subprocess.Popen: The running count process.
     """
-    stdout, error_occurred = execute_system_command(GIT_LOG_CMD, repo_path, timeout)
-    return stdout.split("\n") if not error_occurred else []
+    return subprocess.Popen(
+        ["git", "rev-list", "--count", "HEAD"],
+        cwd=repo_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+    )
 
 
-def set_git_date(
+def finish_commit_count(process: subprocess.Popen, timeout: int = 10) -> int:
+    """
+    Collects the result of a process started by start_commit_count.
+
+    Args:
+        process (subprocess.Popen): The running count process.
+        timeout (int, optional): Timeout in seconds. Defaults to 10.
+
+    Returns:
+        int: Total number of commits, or 0 on error.
+    """
+    try:
+        stdout, _ = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+        return 0
+    return int(stdout) if process.returncode == 0 else 0
+
+
+def set_git_dates(
     repo_path: str,
-    commit: "Commit",  # Принято использовать строковые литералы для forward reference
-    new_date: str,
+    new_dates: dict,
     timeout: int = 600,
 ) -> None:
     """
-    Sets a new date for a Git commit.
+    Sets new dates for Git commits in a single history rewrite.
+
+    Each `git filter-branch` invocation rewrites every commit in the
+    repository, so all pending edits are applied in one pass instead of
+    one pass per edited commit.
 
     Args:
         repo_path (str): Path to the Git repository.
-        commit (Commit): Commit object.
-        new_date (str): New date in '2024.10.8 11:59:23 +0300' format.
+        new_dates (dict): Mapping of commit hash to new date in any format
+            git accepts, e.g. the raw '1728377963 +0300' form.
         timeout (int, optional): Timeout in seconds. Defaults to 600.
     """
-    cmd = GIT_SET_DATE_TEMPLATE.format(commit.hash, new_date, new_date)
-    execute_system_command(cmd, repo_path, timeout)
+    if not new_dates:
+        return
+    env_filter = "\n".join(
+        GIT_SET_DATE_FILTER_TEMPLATE.format(hash, date, date)
+        for hash, date in new_dates.items()
+    )
+    execute_system_command(GIT_SET_DATE_CMD + [env_filter], repo_path, timeout)
 
 
 def main() -> None:
@@ -212,6 +373,15 @@ def main() -> None:
     parser.add_argument("repo_path", type=str, help="Path to the Git repository")
     args = parser.parse_args()
 
+    # questionary and rich pull in prompt_toolkit/pygments — a noticeable
+    # chunk of cold start — so they are imported only once the TUI is
+    # actually about to run.
+    import questionary
+    from rich.console import Console
+    from rich.panel import Panel
+
+    console = Console()
+
     repo_path = Path(args.repo_path).resolve()
 
     if not repo_path.is_dir():
@@ -220,38 +390,71 @@ def main() -> None:
         )
         return
     console.print(Panel(str(repo_path), highlight=True, title="Выбранный репозиторий"))
+    pending_edits = {}
+    offset = 0
     while True:
-        output_lines = get_git_log(repo_path)
-        commits = parse_git_log(output_lines)
+        head = get_git_head(repo_path)
+        count = _count_cache.get(head)
+        count_process = None
+        if count is None:
+            count_process = start_commit_count(repo_path)
+        commits = _log_cache.get((head, offset))
+        if commits is None:
+            # The count process keeps running while the page is streamed.
+            commits = parse_git_log(
+                get_git_log(repo_path, limit=PAGE_SIZE, skip=offset),
+                size_hint=PAGE_SIZE,
+            )
+            _log_cache[(head, offset)] = commits
+        if count_process is not None:
+            count = finish_commit_count(count_process)
+            _count_cache[head] = count
+        # questionary treats a missing "disabled" key as enabled, so the
+        # per-commit dicts carry only the two keys that vary.
         choices = [
-            {"name": str(commit), "value": commit, "disabled": False}
-            for commit in commits
+            {"name": commit.display, "value": commit} for commit in commits
         ]
+        if offset:
+            choices.insert(0, {"name": "<- Previous page", "value": _PREV_PAGE})
+        if offset + PAGE_SIZE < count:
+            choices.append({"name": "Next page ->", "value": _NEXT_PAGE})
         selected_commit = questionary.select(
             "Choose a commit:", choices=choices, default=None
         ).ask()
         if selected_commit is None:
             break
+        if selected_commit == _PREV_PAGE:
+            offset -= PAGE_SIZE
+            continue
+        if selected_commit == _NEXT_PAGE:
+            offset += PAGE_SIZE
+            continue
 
         chosen_date = questionary.text(
             f"Change commit date [{selected_commit.date}]",
-            default=convert_commit_date_to_input_date(selected_commit.date),
+            default=selected_commit.input_date,
         ).ask()
 
         # Validate input date (TODO: implement validation)
         input_date = convert_input_date_to_commit_date(chosen_date)
 
-        console.print(Panel(f"{selected_commit.date} -> {input_date}"))
+        console.print(Panel(f"{selected_commit.date} -> {chosen_date}"))
 
         confirm_change = questionary.confirm("Save changes?", default=False).ask()
         if confirm_change:
-            set_git_date(repo_path, selected_commit, input_date, timeout=60)
-            console.print("[yellow]New date saved[/yellow]")
+            pending_edits[selected_commit.hash] = input_date
+            console.print("[yellow]New date queued[/yellow]")
 
         confirm_continue = questionary.confirm("Continue?", default=True).ask()
         if not confirm_continue:
             break
 
+    if pending_edits:
+        set_git_dates(repo_path, pending_edits, timeout=600)
+        _log_cache.clear()
+        _count_cache.clear()
+        console.print(f"[yellow]{len(pending_edits)} new date(s) saved[/yellow]")
+
     console.print("[green]Thank you![/green]")
 
 